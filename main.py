@@ -1,40 +1,122 @@
+"""
+Entry point for the Trello MCP server.
+
+Middlewares live in server/middleware.py and must stay raw ASGI callables.
+Route endpoints must stay ``async def`` so Starlette does not offload them to
+its threadpool.
+"""
+
+import asyncio
 import logging
 import os
+import sys
 
 import uvicorn
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 from starlette.applications import Starlette
-from starlette.routing import Mount
 from starlette.requests import Request
-from starlette.responses import StreamingResponse, JSONResponse
 import httpx
 import time
 
+from server.middleware import (
+    APIKeyMiddleware,
+    NoBufferingMiddleware,
+    build_role_lookup,
+    health_check,
+)
 from server.tools.tools import register_tools
+from server.utils.log import enable_queue_logging
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
+enable_queue_logging()
 logger = logging.getLogger(__name__)
+# uvicorn imports "main:app" after configuring its loggers, so this also
+# silences per-request access lines when launched as `uvicorn main:app`
+# without access_log=False.
+logging.getLogger("uvicorn.access").disabled = True
 
 # Load environment variables
 load_dotenv()
 
+# uvloop has no Windows build; elsewhere both modes run on it. uvicorn creates
+# its own loop (loop=UVICORN_LOOP) and Claude app mode passes
+# UVLOOP_FACTORY to asyncio.run, so no global event loop policy is installed.
+uvloop = None
+if sys.platform != "win32":
+    try:
+        import uvloop
+    except ImportError:
+        pass
+UVICORN_LOOP = "uvloop" if uvloop else "asyncio"
+UVLOOP_FACTORY = uvloop.new_event_loop if uvloop else None
+
+
+def _parse_keys(value: str) -> frozenset[str]:
+    """Parse a comma separated list of API keys into a set."""
+    return frozenset(k.strip() for k in value.split(",") if k.strip())
+
+
+# Parse server configuration once at import time
+MCP_SERVER_HOST = os.getenv("MCP_SERVER_HOST", "0.0.0.0")
+MCP_SERVER_PORT = int(os.getenv("MCP_SERVER_PORT", "8000"))
+MCP_WORKERS = int(os.getenv("MCP_WORKERS", "1"))
+# Check which mode to run in (default to true for Claude app mode)
+USE_CLAUDE_APP = os.getenv("USE_CLAUDE_APP", "true").lower() == "true"
+
+# API keys for different roles
+MCP_API_KEYS_READ_ONLY = _parse_keys(os.getenv("MCP_API_KEY_READ_ONLY", ""))
+MCP_API_KEYS_READ_WRITE = _parse_keys(os.getenv("MCP_API_KEY_READ_WRITE", ""))
+# Falling back to MCP_API_KEY as READ_WRITE for backward compatibility if configured
+MCP_API_KEYS_LEGACY = (
+    _parse_keys(os.getenv("MCP_API_KEY", ""))
+    if not (MCP_API_KEYS_READ_ONLY or MCP_API_KEYS_READ_WRITE)
+    else frozenset()
+)
+if MCP_API_KEYS_LEGACY:
+    logger.info("Using legacy MCP_API_KEY as READ_WRITE")
+MCP_API_KEY_ROLES = build_role_lookup(
+    MCP_API_KEYS_READ_ONLY, MCP_API_KEYS_READ_WRITE | MCP_API_KEYS_LEGACY
+)
+
 
 from mcp.server.fastmcp.server import TransportSecuritySettings
 
 # Initialize MCP server with security settings to allow VPS hosts
+# Sessions live in process memory, so with several workers each request must
+# be self-contained (stateless) because it may land on any worker.
 mcp = FastMCP(
     "Trello MCP Server",
-    transport_security=TransportSecuritySettings(enable_dns_rebinding_protection=False)
+    transport_security=TransportSecuritySettings(enable_dns_rebinding_protection=False),
+    stateless_http=MCP_WORKERS > 1,
 )
 
 # Register tools
 register_tools(mcp)
 
 
+async def _close_trello_client():
+    """Release the pooled Trello connections shared by all tools.
+
+    server.trello builds (and validates) the client when first imported, so
+    if no tool ever ran there is nothing to close and it is not imported.
+    """
+    trello = sys.modules.get("server.trello")
+    if trello is not None:
+        await trello.client.close()
+
+
+async def _run_stdio():
+    """Serve over stdio, then release the pooled Trello connections."""
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await _close_trello_client()
+
+
 def start_claude_server():
     """Start the MCP server in Claude app mode"""
     try:
@@ -45,13 +127,75 @@ def start_claude_server():
             )
 
         logger.info("Starting Trello MCP Server in Claude app mode...")
-        mcp.run()
+        asyncio.run(_run_stdio(), loop_factory=UVLOOP_FACTORY)
         logger.info("Trello MCP Server started successfully")
     except Exception as e:
-        logger.error(f"Error starting Claude server: {str(e)}")
+        logger.error("Error starting Claude server: %s", e)
         raise
 
 
+def build_app() -> Starlette:
+    """Build the Streamable HTTP ASGI app served by uvicorn"""
+    # Create the session manager directly with the same arguments
+    # mcp.streamable_http_app() uses, without building its unused app.
+    # Keep these in sync with FastMCP.streamable_http_app when upgrading mcp.
+    from mcp.server.fastmcp.server import StreamableHTTPASGIApp
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+
+    if mcp._session_manager is None:
+        mcp._session_manager = StreamableHTTPSessionManager(
+            app=mcp._mcp_server,
+            event_store=mcp._event_store,
+            retry_interval=mcp._retry_interval,
+            json_response=mcp.settings.json_response,
+            stateless=mcp.settings.stateless_http,
+            security_settings=mcp.settings.transport_security,
+        )
+
+    from starlette.routing import Route
+    from starlette.middleware import Middleware
+    from starlette.middleware.cors import CORSMiddleware
+    from contextlib import asynccontextmanager
+
+    middleware = [
+         Middleware(
+             CORSMiddleware,
+             allow_origins=["*"],
+             allow_credentials=True,
+             allow_methods=["*"],
+             allow_headers=["*"],
+         ),
+         Middleware(NoBufferingMiddleware),
+         Middleware(APIKeyMiddleware, role_lookup=MCP_API_KEY_ROLES)
+    ]
+
+    @asynccontextmanager
+    async def lifespan(app):
+        try:
+            async with mcp._session_manager.run():
+                yield
+        finally:
+            await _close_trello_client()
+
+    # Manually create the ASGI app using the initialized session manager
+    # This gives us control over the route methods
+    stream_handler = StreamableHTTPASGIApp(mcp._session_manager)
+
+    return Starlette(routes=[
+        Route("/health", endpoint=health_check, methods=["GET", "HEAD"]),
+        # /mcp and /mcp/ (plus any subpath) are both served directly, without
+        # a redirect (redirects cause some clients to lose the Authorization
+        # header); /mcpfoo and other paths still 404.
+        Route("/mcp", endpoint=stream_handler, methods=["GET", "POST", "DELETE"]),
+        Route("/mcp/{path:path}", endpoint=stream_handler, methods=["GET", "POST", "DELETE"]),
+    ], middleware=middleware, lifespan=lifespan)
+
+
+# Build the ASGI app once at import time so uvicorn workers (and --reload)
+# can import a ready "main:app"; Claude app mode never serves HTTP.
+app = None if USE_CLAUDE_APP else build_app()
+
+
 def start_mcp_server():
     """Start the MCP server in Streamable HTTP mode using uvicorn"""
     try:
@@ -61,169 +205,37 @@ def start_mcp_server():
                 "TRELLO_API_KEY and TRELLO_TOKEN must be set in environment variables"
             )
 
-        host = os.getenv("MCP_SERVER_HOST", "0.0.0.0")
-        port = int(os.getenv("MCP_SERVER_PORT", "8000"))
-
-        # Initialize session manager via side-effect (creates mcp._session_manager)
-        _ = mcp.streamable_http_app()
-        
-        # Import the ASGI app class
-        from mcp.server.fastmcp.server import StreamableHTTPASGIApp
-
-        from starlette.routing import Mount, Route
-        from starlette.middleware import Middleware
-        from starlette.middleware.cors import CORSMiddleware
-        from starlette.middleware.base import BaseHTTPMiddleware
-        from contextlib import asynccontextmanager
-        from starlette.responses import PlainTextResponse
-
-        class NoBufferingMiddleware:
-            def __init__(self, app):
-                self.app = app
-
-            async def __call__(self, scope, receive, send):
-                if scope["type"] != "http":
-                    await self.app(scope, receive, send)
-                    return
-
-                async def send_wrapper(message):
-                    if message["type"] == "http.response.start":
-                        headers = getattr(message, "get", lambda x: [])("headers") or []
-                        if isinstance(headers, tuple):
-                           headers = list(headers)
-                        
-                        # Check definition of headers
-                        is_sse = False
-                        for name, value in headers:
-                            if name.lower() == b"content-type" and b"text/event-stream" in value:
-                                is_sse = True
-                                break
-                        
-                        if is_sse:
-                            headers.append((b"x-accel-buffering", b"no"))
-                            headers.append((b"cache-control", b"no-cache"))
-                            headers.append((b"connection", b"keep-alive"))
-                            headers.append((b"content-encoding", b"identity"))
-                            headers.append((b"x-content-type-options", b"nosniff"))
-                            message["headers"] = headers
-                            
-                    await send(message)
-
-                await self.app(scope, receive, send_wrapper)
-
-        from server.utils.auth import api_key_role, Role
-
-        class APIKeyMiddleware:
-            def __init__(self, app):
-                self.app = app
-                # Support multiple API keys for different roles
-                ro_keys_str = os.getenv("MCP_API_KEY_READ_ONLY", "")
-                rw_keys_str = os.getenv("MCP_API_KEY_READ_WRITE", "")
-                
-                # Falling back to MCP_API_KEY as READ_WRITE for backward compatibility if configured
-                legacy_keys_str = os.getenv("MCP_API_KEY", "") if not (ro_keys_str or rw_keys_str) else ""
-                
-                self.ro_keys = [k.strip() for k in ro_keys_str.split(",") if k.strip()]
-                self.rw_keys = [k.strip() for k in rw_keys_str.split(",") if k.strip()]
-                
-                if legacy_keys_str:
-                    logger.info("Using legacy MCP_API_KEY as READ_WRITE")
-                    self.rw_keys.extend([k.strip() for k in legacy_keys_str.split(",") if k.strip()])
-
-                logger.info(f"DEBUG: RBAC Configured - RO keys: {len(self.ro_keys)}, RW keys: {len(self.rw_keys)}")
-
-            async def __call__(self, scope, receive, send):
-                if scope["type"] != "http":
-                    await self.app(scope, receive, send)
-                    return
-
-                # Skip auth for health check and OPTIONS (CORS preflight)
-                if scope["path"] == "/health" or scope["method"] == "OPTIONS":
-                    await self.app(scope, receive, send)
-                    return
-
-                if not self.ro_keys and not self.rw_keys:
-                    logger.info("DEBUG: No API Keys configured, allowing as READ_WRITE by default")
-                    api_key_role.set(Role.READ_WRITE)
-                    await self.app(scope, receive, send)
-                    return
-
-                headers = dict(scope["headers"])
-                auth_header = headers.get(b"authorization", b"").decode("latin-1")
-                token = auth_header[7:] if auth_header.startswith("Bearer ") else ""
-                
-                role = None
-                if token:
-                    if token in self.rw_keys:
-                        role = Role.READ_WRITE
-                    elif token in self.ro_keys:
-                        role = Role.READ_ONLY
-
-                if role is None:
-                    logger.warning(f"DEBUG: Auth Failed for token prefix: {token[:4]}... Returning 401.")
-                    response = JSONResponse(
-                        {"error": "Unauthorized", "message": "Invalid or missing API Key"}, 
-                        status_code=401
-                    )
-                    await response(scope, receive, send)
-                    return
-                
-                logger.info(f"DEBUG: Auth Success. Role: {role.value}")
-                api_key_role.set(role)
-                await self.app(scope, receive, send)
-
-        middleware = [
-             Middleware(
-                 CORSMiddleware,
-                 allow_origins=["*"],
-                 allow_credentials=True,
-                 allow_methods=["*"],
-                 allow_headers=["*"],
-             ),
-             Middleware(NoBufferingMiddleware),
-             Middleware(APIKeyMiddleware)
-        ]
-
-        async def health_check(request):
-            return PlainTextResponse(f"OK. Path: {request.url.path}")
-
-        @asynccontextmanager
-        async def lifespan(app):
-            # Verify if session manager is initialized and run it
-            if hasattr(mcp, "_session_manager") and mcp._session_manager:
-                 async with mcp._session_manager.run():
-                     yield
-            else:
-                 yield
-        
-        # Manually create the ASGI app using the initialized session manager
-        # This gives us control over the route methods
-        stream_handler = StreamableHTTPASGIApp(mcp._session_manager)
-
-        app = Starlette(routes=[
-            Route("/health", endpoint=health_check),
-            # Handle /mcp without trailing slash explicitly to avoid redirects
-            # that cause some clients to lose the Authorization header.
-            Route("/mcp", endpoint=stream_handler, methods=["GET", "POST", "DELETE"]),
-            # Mount handles subpaths and /mcp/
-            Mount("/mcp", app=stream_handler),
-        ], middleware=middleware, lifespan=lifespan)
+        host = MCP_SERVER_HOST
+        port = MCP_SERVER_PORT
 
         logger.info(
-            f"Starting Trello MCP Server in Streamable HTTP mode on http://{host}:{port}..."
+            "Starting Trello MCP Server in Streamable HTTP mode on http://%s:%s...",
+            host,
+            port,
+        )
+        # Request httptools explicitly so a missing uvicorn[standard] install
+        # fails at startup instead of silently falling back to h11.
+        # Workers import "main:app" themselves; a single process reuses the
+        # app already built at import time.
+        uvicorn.run(
+            "main:app" if MCP_WORKERS > 1 else app,
+            workers=MCP_WORKERS,
+            host=host,
+            port=port,
+            loop=UVICORN_LOOP,
+            http="httptools",
+            log_level="info",
+            # Per-request access lines cost more than the proxying itself
+            access_log=False,
         )
-        uvicorn.run(app, host=host, port=port)
     except Exception as e:
-        logger.error(f"Error starting MCP server: {str(e)}")
+        logger.error("Error starting MCP server: %s", e)
         raise
 
 
 if __name__ == "__main__":
     try:
-        # Check which mode to run in (default to true for Claude app mode)
-        use_claude = os.getenv("USE_CLAUDE_APP", "true").lower() == "true"
-
-        if use_claude:
+        if USE_CLAUDE_APP:
             # Run in Claude app mode
             start_claude_server()
         else:
@@ -232,5 +244,5 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.info("Shutting down server...")
     except Exception as e:
-        logger.error(f"Server error: {str(e)}")
+        logger.error("Server error: %s", e)
         raise
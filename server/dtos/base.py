@@ -0,0 +1,27 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class TrelloPayload(BaseModel):
+    """
+    Base class for request payloads sent to the Trello API.
+
+    Payloads are flat models of plain values, so the request body is read
+    straight off the fields the caller set instead of going through
+    ``model_dump``.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    def to_api_dict(self, exclude_none: bool = True) -> dict:
+        """
+        Returns the fields the caller set, ready to send to Trello.
+
+        Args:
+            exclude_none (bool): Drop fields explicitly set to None. Pass
+                False for updates, where None clears the field on Trello.
+        """
+        return {
+            name: value
+            for name in self.__pydantic_fields_set__
+            if (value := getattr(self, name)) is not None or not exclude_none
+        }
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from server.dtos.base import TrelloPayload
 
 
-class CreateCardPayload(BaseModel):
+class CreateCardPayload(TrelloPayload):
     """
     Payload for creating a card.
 
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from server.dtos.base import TrelloPayload
 
 
-class CreateLabelPayload(BaseModel):
+class CreateLabelPayload(TrelloPayload):
     """
     Payload for creating a label.
 
@@ -11,4 +11,4 @@ class CreateLabelPayload(BaseModel):
     """
 
     name: str
-    color: str | None = None
\ No newline at end of file
+    color: str | None = None
@@ -1,9 +1,10 @@
-from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import Field
 
-class UpdateBoardPayload(BaseModel):
+from server.dtos.base import TrelloPayload
+
+class UpdateBoardPayload(TrelloPayload):
     """Payload for updating a Trello board."""
-    name: Optional[str] = Field(None, description="The new name of the board.")
-    desc: Optional[str] = Field(None, description="The new description of the board.")
-    closed: Optional[bool] = Field(None, description="Whether the board is archived/closed.")
-    prefs_background: Optional[str] = Field(None, description="The background color or image for the board.")
+    name: str | None = Field(None, description="The new name of the board.")
+    desc: str | None = Field(None, description="The new description of the board.")
+    closed: bool | None = Field(None, description="Whether the board is archived/closed.")
+    prefs_background: str | None = Field(None, description="The background color or image for the board.")
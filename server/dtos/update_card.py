@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from server.dtos.base import TrelloPayload
 
 
-class UpdateCardPayload(BaseModel):
+class UpdateCardPayload(TrelloPayload):
     """
     Payload for updating a card.
 
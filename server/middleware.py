@@ -0,0 +1,173 @@
+"""
+ASGI middlewares and endpoints shared by the HTTP entry points.
+
+All middlewares must be raw ASGI callables: BaseHTTPMiddleware pipes every
+body chunk through an anyio memory object stream, which copies large payloads
+and breaks SSE streaming.
+"""
+
+import logging
+from typing import Iterable, Mapping
+
+from server.utils.auth import Role, api_key_role
+
+logger = logging.getLogger(__name__)
+
+# Headers added to SSE responses so reverse proxies (nginx: X-Accel-Buffering)
+# stream events immediately instead of buffering them
+SSE_EXTRA_HEADERS = (
+    (b"x-accel-buffering", b"no"),
+    (b"cache-control", b"no-cache, no-transform"),
+    (b"connection", b"keep-alive"),
+    (b"content-encoding", b"identity"),
+    (b"x-content-type-options", b"nosniff"),
+)
+SSE_EXTRA_HEADER_NAMES = frozenset(name for name, _ in SSE_EXTRA_HEADERS)
+
+
+def build_role_lookup(
+    read_only: Iterable[str], read_write: Iterable[str]
+) -> dict[bytes, Role]:
+    """Map raw API key bytes to their role.
+
+    A key listed under both roles keeps READ_WRITE.
+    """
+    return {
+        **dict.fromkeys((k.encode() for k in read_only), Role.READ_ONLY),
+        **dict.fromkeys((k.encode() for k in read_write), Role.READ_WRITE),
+    }
+
+
+class NoBufferingMiddleware:
+    """Sets proxy anti-buffering headers on SSE responses.
+
+    Any value the app already sent for one of these headers is replaced, so
+    the response never carries conflicting duplicates. Body messages pass
+    through untouched.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        # Only GET and POST on /mcp can answer with an SSE stream
+        # (Streamable HTTP replies to POST with text/event-stream too),
+        # so health checks, CORS preflights and DELETE skip the wrapper.
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "POST")
+            or scope["path"] == "/health"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = message.get("headers") or []
+                if any(
+                    name == b"content-type" and b"text/event-stream" in value
+                    for name, value in headers
+                ):
+                    message["headers"] = [
+                        header for header in headers
+                        if header[0] not in SSE_EXTRA_HEADER_NAMES
+                    ]
+                    message["headers"] += SSE_EXTRA_HEADERS
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class APIKeyMiddleware:
+    """Authenticates Bearer API keys and stores the caller's role.
+
+    Args:
+        role_lookup (Mapping[bytes, Role] | None): API key bytes mapped to their
+            role. When empty or None every request is allowed as READ_WRITE.
+    """
+
+    # The 401 body and headers never change, so they are encoded once. The
+    # message dicts are rebuilt per rejection: outer middlewares (CORS) edit
+    # message["headers"] in place and must not see a shared list.
+    UNAUTHORIZED_BODY = b'{"error":"Unauthorized","message":"Invalid or missing API Key"}'
+    UNAUTHORIZED_HEADERS = (
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(UNAUTHORIZED_BODY)).encode("latin-1")),
+    )
+
+    def __init__(self, app, role_lookup: Mapping[bytes, Role] | None = None):
+        self.app = app
+        self.tokens = role_lookup or {}
+
+        logger.debug(
+            "RBAC Configured - RO keys: %d, RW keys: %d",
+            sum(role is Role.READ_ONLY for role in self.tokens.values()),
+            sum(role is Role.READ_WRITE for role in self.tokens.values()),
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Skip auth for health check and OPTIONS (CORS preflight)
+        if scope["path"] == "/health" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        if not self.tokens:
+            logger.debug("No API Keys configured, allowing as READ_WRITE by default")
+            api_key_role.set(Role.READ_WRITE)
+            await self.app(scope, receive, send)
+            return
+
+        auth_header = next(
+            (value for name, value in scope["headers"] if name == b"authorization"),
+            b"",
+        )
+        token = auth_header[7:] if auth_header.startswith(b"Bearer ") else b""
+
+        role = self.tokens.get(token)
+
+        if role is None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Auth Failed for token prefix: %s... Returning 401.",
+                    token[:4].decode("latin-1"),
+                )
+            await send({
+                "type": "http.response.start",
+                "status": 401,
+                "headers": list(self.UNAUTHORIZED_HEADERS),
+            })
+            await send({"type": "http.response.body", "body": self.UNAUTHORIZED_BODY})
+            return
+
+        logger.debug("Auth Success. Role: %s", role.value)
+        api_key_role.set(role)
+        await self.app(scope, receive, send)
+
+
+class HealthCheck:
+    """Answers the liveness probe as a raw ASGI app.
+
+    Probes hit this constantly, so it skips building a Request and Response
+    and sends its two messages directly.
+    """
+
+    START_HEADERS = [(b"content-type", b"text/plain; charset=utf-8")]
+
+    async def __call__(self, scope, receive, send):
+        body = b"OK. Path: " + scope["path"].encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": self.START_HEADERS + [
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+health_check = HealthCheck()
@@ -1,7 +1,8 @@
 import logging
 from typing import List, Dict, Any, Optional
 
-from server.trello import TrelloClient
+from server.utils.trello_api import TrelloClient
+from server.utils.cache import cached, invalidate
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +10,7 @@ class AttachmentService:
     def __init__(self, client: TrelloClient):
         self.client = client
 
+    @cached("normal")
     async def get_attachments(self, card_id: str) -> List[Dict[str, Any]]:
         """Get all attachments for a card."""
         return await self.client.GET(f"/cards/{card_id}/attachments")
@@ -23,9 +25,12 @@ class AttachmentService:
         if name:
             payload["name"] = name
             
-        return await self.client.POST(f"/cards/{card_id}/attachments", data=payload)
+        response = await self.client.POST(f"/cards/{card_id}/attachments", data=payload)
+        invalidate(self.get_attachments, arg=card_id)
+        return response
 
     async def delete_attachment(self, card_id: str, attachment_id: str) -> bool:
         """Delete an attachment from a card."""
         await self.client.DELETE(f"/cards/{card_id}/attachments/{attachment_id}")
+        invalidate(self.get_attachments, arg=card_id)
         return True
@@ -2,11 +2,40 @@
 Service for managing Trello boards in MCP server.
 """
 
-from typing import List
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
 
+from pydantic import TypeAdapter
+
+from server.dtos.create_board import CreateBoardPayload
+from server.dtos.create_label import CreateLabelPayload
+from server.dtos.update_board import UpdateBoardPayload
 from server.models import TrelloBoard, TrelloLabel, TrelloMember, TrelloWorkspace
+from server.utils.cache import cached, invalidate, priming
 from server.utils.trello_api import TrelloClient
 
+# Module-level adapters validate a whole list response in one pydantic-core
+# call instead of building each model in a Python loop, and are built once
+# rather than per request. The card and list services follow the same pattern.
+_BOARD_LIST = TypeAdapter(List[TrelloBoard])
+_LABEL_LIST = TypeAdapter(List[TrelloLabel])
+_MEMBER_LIST = TypeAdapter(List[TrelloMember])
+_WORKSPACE_LIST = TypeAdapter(List[TrelloWorkspace])
+
+# Most board detail requests in flight at once for get_boards_with_details,
+# keeping a large account well under Trello's 100 requests / 10s token limit
+BOARD_DETAILS_CONCURRENCY = 10
+
+# Nested resources returned alongside the board by get_board_bundle. The
+# actions match get_board_actions' defaults so the bundle can prime them.
+_BUNDLE_ACTIONS_LIMIT = 50
+_BUNDLE_PARAMS = {
+    "labels": "all",
+    "members": "all",
+    "actions": "all",
+    "actions_limit": _BUNDLE_ACTIONS_LIMIT,
+}
+
 
 class BoardService:
     """
@@ -16,11 +45,13 @@ class BoardService:
     def __init__(self, client: TrelloClient):
         self.client = client
 
+    @cached("normal")
     async def get_board(self, board_id: str) -> TrelloBoard:
         """Retrieves a specific board by its ID."""
         response = await self.client.GET(f"/boards/{board_id}")
-        return TrelloBoard(**response)
+        return TrelloBoard.model_validate(response)
 
+    @cached("normal")
     async def get_boards(self, member_id: str = "me", filter: str = "open") -> List[TrelloBoard]:
         """Retrieves all boards for a given member.
         
@@ -30,13 +61,15 @@ class BoardService:
         """
         params = {"filter": filter}
         response = await self.client.GET(f"/members/{member_id}/boards", params=params)
-        return [TrelloBoard(**board) for board in response]
+        return _BOARD_LIST.validate_python(response)
 
+    @cached("long")
     async def get_workspaces(self) -> List[TrelloWorkspace]:
         """Retrieves all workspaces (organizations) for the authenticated user."""
         response = await self.client.GET("/members/me/organizations")
-        return [TrelloWorkspace(**ws) for ws in response]
+        return _WORKSPACE_LIST.validate_python(response)
 
+    @cached("normal")
     async def get_workspace_boards(self, workspace_id: str, filter: str = "open") -> List[TrelloBoard]:
         """Retrieves all boards within a specific workspace.
         
@@ -46,8 +79,9 @@ class BoardService:
         """
         params = {"filter": filter}
         response = await self.client.GET(f"/organizations/{workspace_id}/boards", params=params)
-        return [TrelloBoard(**board) for board in response]
+        return _BOARD_LIST.validate_python(response)
 
+    @cached("normal")
     async def get_board_labels(self, board_id: str) -> List[TrelloLabel]:
         """Retrieves all labels for a specific board.
 
@@ -58,51 +92,152 @@ class BoardService:
             List[TrelloLabel]: A list of label objects for the board.
         """
         response = await self.client.GET(f"/boards/{board_id}/labels")
-        return [TrelloLabel(**label) for label in response]
+        return _LABEL_LIST.validate_python(response)
 
-    async def create_board_label(self, board_id: str, **kwargs) -> TrelloLabel:
+    async def create_board_label(self, board_id: str, payload: CreateLabelPayload) -> TrelloLabel:
         """Create label for a specific board.
 
         Args:
             board_id (str): The ID of the board whose to add label.
+            payload (CreateLabelPayload): The name and color of the label.
 
         Returns:
-            List[TrelloLabel]: A list of label objects for the board.
+            TrelloLabel: The created label object.
         """
-        response = await self.client.POST(f"/boards/{board_id}/labels", data=kwargs)
-        return TrelloLabel(**response)
+        data = payload.to_api_dict()
+        response = await self.client.POST(f"/boards/{board_id}/labels", data=data)
+        invalidate(self.get_board_labels, arg=board_id)
+        return TrelloLabel.model_validate(response)
 
+    @cached("normal")
     async def get_board_members(self, board_id: str) -> List[TrelloMember]:
         """Retrieves all members for a specific board."""
         response = await self.client.GET(f"/boards/{board_id}/members")
-        return [TrelloMember(**member) for member in response]
+        return _MEMBER_LIST.validate_python(response)
+
+    async def get_board_bundle(self, board_id: str) -> Dict[str, Any]:
+        """Retrieves a board with its labels, members and recent actions.
+
+        Trello nests all of them in a single /boards/{id} response. The parts
+        are also stored in the cache, so a following get_board,
+        get_board_labels, get_board_members or default get_board_actions call
+        for this board is served without another request.
+
+        Args:
+            board_id (str): The ID of the board.
 
-    async def create_board(self, name: str, **kwargs) -> TrelloBoard:
+        Returns:
+            Dict[str, Any]: The board under "board", plus its "labels",
+                "members" and "actions".
+        """
+        with priming(
+            (self.get_board, board_id),
+            (self.get_board_labels, board_id),
+            (self.get_board_members, board_id),
+            (self.get_board_actions, board_id, "all", _BUNDLE_ACTIONS_LIMIT),
+        ) as prime:
+            response = await self.client.GET(f"/boards/{board_id}", params=_BUNDLE_PARAMS)
+            board = TrelloBoard.model_validate(response)
+            labels = _LABEL_LIST.validate_python(response.get("labels", []))
+            members = _MEMBER_LIST.validate_python(response.get("members", []))
+            actions = response.get("actions", [])
+
+            prime(self.get_board, board_id, value=board)
+            prime(self.get_board_labels, board_id, value=labels)
+            prime(self.get_board_members, board_id, value=members)
+            prime(self.get_board_actions, board_id, "all", _BUNDLE_ACTIONS_LIMIT, value=actions)
+        return {"board": board, "labels": labels, "members": members, "actions": actions}
+
+    async def get_boards_with_details(
+        self,
+        filter: str = "open",
+        include_labels: bool = True,
+        include_members: bool = False,
+        on_progress: Callable[[int, int], Awaitable[None]] | None = None,
+    ) -> List[Dict[str, Any]]:
+        """Retrieves the user's boards together with their labels and/or members.
+
+        The per-board requests run concurrently, at most
+        BOARD_DETAILS_CONCURRENCY boards at a time.
+
+        Args:
+            filter (str): Filter for board status. Defaults to "open".
+            include_labels (bool): Whether to fetch each board's labels.
+            include_members (bool): Whether to fetch each board's members.
+            on_progress (Callable, optional): Awaited with (done, total) each
+                time a board's details arrive, in completion order.
+
+        Returns:
+            List[Dict[str, Any]]: One entry per board with the board under
+                "board" and the requested "labels" and/or "members".
+        """
+        boards = await self.get_boards(filter=filter)
+        semaphore = asyncio.Semaphore(BOARD_DETAILS_CONCURRENCY)
+
+        async def fetch_details(index: int, board: TrelloBoard):
+            details: Dict[str, Any] = {"board": board}
+            async with semaphore:
+                if include_labels and include_members:
+                    details["labels"], details["members"] = await asyncio.gather(
+                        self.get_board_labels(board.id),
+                        self.get_board_members(board.id),
+                    )
+                elif include_labels:
+                    details["labels"] = await self.get_board_labels(board.id)
+                elif include_members:
+                    details["members"] = await self.get_board_members(board.id)
+            return index, details
+
+        tasks = [
+            asyncio.ensure_future(fetch_details(index, board))
+            for index, board in enumerate(boards)
+        ]
+        results: List[Dict[str, Any]] = [None] * len(tasks)
+        try:
+            for done, next_done in enumerate(asyncio.as_completed(tasks), 1):
+                index, details = await next_done
+                results[index] = details
+                if on_progress is not None:
+                    await on_progress(done, len(tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+        return results
+
+    async def create_board(self, payload: CreateBoardPayload) -> TrelloBoard:
         """Creates a new board.
         
         Args:
-            name (str): The name of the board.
-            **kwargs: Optional Trello board parameters (desc, idOrganization, defaultLists, etc.)
+            payload (CreateBoardPayload): The board name and optional Trello board
+                parameters (desc, idOrganization, defaultLists, etc.)
         """
-        data = {"name": name, **kwargs}
+        data = payload.to_api_dict()
         response = await self.client.POST("/boards", data=data)
-        return TrelloBoard(**response)
+        invalidate(self.get_boards, self.get_workspace_boards)
+        return TrelloBoard.model_validate(response)
 
-    async def update_board(self, board_id: str, **kwargs) -> TrelloBoard:
+    async def update_board(self, board_id: str, payload: UpdateBoardPayload) -> TrelloBoard:
         """Updates an existing board's attributes.
         
         Args:
             board_id (str): The ID of the board to update.
-            **kwargs: Attributes to update (name, desc, closed, etc.)
+            payload (UpdateBoardPayload): Attributes to update (name, desc, closed, etc.)
+                Only fields the caller set are sent, so an explicit None (e.g.
+                desc) clears it.
         """
-        response = await self.client.PUT(f"/boards/{board_id}", data=kwargs)
-        return TrelloBoard(**response)
+        data = payload.to_api_dict(exclude_none=False)
+        response = await self.client.PUT(f"/boards/{board_id}", data=data)
+        invalidate(self.get_board, arg=board_id)
+        invalidate(self.get_boards, self.get_workspace_boards)
+        return TrelloBoard.model_validate(response)
 
+    @cached("long")
     async def get_me(self) -> TrelloMember:
         """Retrieves the authenticated user's profile."""
         response = await self.client.GET("/members/me")
-        return TrelloMember(**response)
+        return TrelloMember.model_validate(response)
 
+    @cached("short")
     async def get_board_actions(self, board_id: str, filter: str = "all", limit: int = 50) -> List[dict]:
         """Retrieves recent actions/activity for a board.
         
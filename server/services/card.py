@@ -4,9 +4,17 @@ Service for managing Trello cards in MCP server.
 
 from typing import Any, Dict, List
 
+from pydantic import TypeAdapter
+
+from server.dtos.copy_card import CopyCardPayload
+from server.dtos.create_card import CreateCardPayload
+from server.dtos.update_card import UpdateCardPayload
 from server.models import TrelloCard
 from server.utils.trello_api import TrelloClient
 
+# Cards of a list, as returned by GET /lists/{id}/cards
+_CARD_LIST = TypeAdapter(List[TrelloCard])
+
 
 class CardService:
     """
@@ -26,7 +34,7 @@ class CardService:
             TrelloCard: The card object containing card details.
         """
         response = await self.client.GET(f"/cards/{card_id}")
-        return TrelloCard(**response)
+        return TrelloCard.model_validate(response)
 
     async def get_cards(self, list_id: str) -> List[TrelloCard]:
         """Retrieves all cards in a given list.
@@ -38,34 +46,36 @@ class CardService:
             List[TrelloCard]: A list of card objects.
         """
         response = await self.client.GET(f"/lists/{list_id}/cards")
-        return [TrelloCard(**card) for card in response]
+        return _CARD_LIST.validate_python(response)
 
-    async def create_card(self, **kwargs) -> TrelloCard:
+    async def create_card(self, payload: CreateCardPayload) -> TrelloCard:
         """Creates a new card in a given list.
 
-        Args
-            list_id (str): The ID of the list to create the card in.
-            name (str): The name of the new card.
-            desc (str, optional): The description of the new card. Defaults to None.
+        Args:
+            payload (CreateCardPayload): The attributes of the new card. Fields
+                left as None are not sent to Trello.
 
         Returns:
             TrelloCard: The newly created card object.
         """
-        response = await self.client.POST("/cards", data=kwargs)
-        return TrelloCard(**response)
+        data = payload.to_api_dict()
+        response = await self.client.POST("/cards", data=data)
+        return TrelloCard.model_validate(response)
 
-    async def update_card(self, card_id: str, **kwargs) -> TrelloCard:
+    async def update_card(self, card_id: str, payload: UpdateCardPayload) -> TrelloCard:
         """Updates a card's attributes.
 
         Args:
             card_id (str): The ID of the card to update.
-            **kwargs: Keyword arguments representing the attributes to update on the card.
+            payload (UpdateCardPayload): The attributes to update. Only fields the
+                caller set are sent, so an explicit None (e.g. due) clears it.
 
         Returns:
             TrelloCard: The updated card object.
         """
-        response = await self.client.PUT(f"/cards/{card_id}", data=kwargs)
-        return TrelloCard(**response)
+        data = payload.to_api_dict(exclude_none=False)
+        response = await self.client.PUT(f"/cards/{card_id}", data=data)
+        return TrelloCard.model_validate(response)
 
     async def delete_card(self, card_id: str) -> Dict[str, Any]:
         """Deletes a card.
@@ -98,14 +108,28 @@ class CardService:
         response = await self.client.DELETE(f"/cards/{card_id}/idMembers/{member_id}")
         return response
 
-    async def copy_card(self, idCardSource: str, idList: str, **kwargs) -> TrelloCard:
+    async def set_members(self, card_id: str, member_ids: List[str]) -> TrelloCard:
+        """Replaces all members of a card in a single request.
+
+        Args:
+            card_id (str): The ID of the card.
+            member_ids (List[str]): The IDs of every member the card should
+                have. An empty list removes all members.
+
+        Returns:
+            TrelloCard: The updated card object.
+        """
+        data = {"idMembers": ",".join(member_ids)}
+        response = await self.client.PUT(f"/cards/{card_id}", data=data)
+        return TrelloCard.model_validate(response)
+
+    async def copy_card(self, payload: CopyCardPayload) -> TrelloCard:
         """Clones an existing card.
         
         Args:
-            idCardSource (str): The ID of the card to copy.
-            idList (str): The ID of the list to place the new card in.
-            **kwargs: Additional attributes to override in the new card.
+            payload (CopyCardPayload): The source card, target list and any
+                attributes to override in the new card.
         """
-        data = {"idCardSource": idCardSource, "idList": idList, **kwargs}
+        data = payload.to_api_dict()
         response = await self.client.POST("/cards", data=data)
-        return TrelloCard(**response)
+        return TrelloCard.model_validate(response)
@@ -1,7 +1,8 @@
 import logging
 from typing import List, Dict, Any, Optional, Union
 
-from server.trello import TrelloClient
+from server.utils.cache import cached, invalidate
+from server.utils.trello_api import TrelloClient
 
 logger = logging.getLogger(__name__)
 
@@ -9,10 +10,12 @@ class CustomFieldService:
     def __init__(self, client: TrelloClient):
         self.client = client
 
+    @cached("long")
     async def get_board_custom_fields(self, board_id: str) -> List[Dict[str, Any]]:
         """Get all custom field definitions for a board."""
         return await self.client.GET(f"/boards/{board_id}/customFields")
 
+    @cached("normal")
     async def get_card_custom_fields(self, card_id: str) -> List[Dict[str, Any]]:
         """Get all custom field items for a card."""
         return await self.client.GET(f"/cards/{card_id}/customFieldItems")
@@ -43,7 +46,9 @@ class CustomFieldService:
              # e.g. {"text": "hello"}
              payload = {"value": value}
 
-        return await self.client.PUT(
+        response = await self.client.PUT(
             f"/cards/{card_id}/customField/{custom_field_id}/item",
             data=payload
         )
+        invalidate(self.get_card_custom_fields, arg=card_id)
+        return response
@@ -1,8 +1,14 @@
 from typing import List
 
+from pydantic import TypeAdapter
+
 from server.models import TrelloList
+from server.utils.cache import cached, invalidate
 from server.utils.trello_api import TrelloClient
 
+# Lists of a board, as returned by GET /boards/{id}/lists
+_LIST_LIST = TypeAdapter(List[TrelloList])
+
 
 class ListService:
     """
@@ -23,8 +29,9 @@ class ListService:
             TrelloList: The list object containing list details.
         """
         response = await self.client.GET(f"/lists/{list_id}")
-        return TrelloList(**response)
+        return TrelloList.model_validate(response)
 
+    @cached("normal")
     async def get_lists(self, board_id: str) -> List[TrelloList]:
         """Retrieves all lists on a given board.
 
@@ -35,7 +42,7 @@ class ListService:
             List[TrelloList]: A list of list objects.
         """
         response = await self.client.GET(f"/boards/{board_id}/lists")
-        return [TrelloList(**list_data) for list_data in response]
+        return _LIST_LIST.validate_python(response)
 
     async def create_list(
         self, board_id: str, name: str, pos: str = "bottom"
@@ -52,7 +59,8 @@ class ListService:
         """
         data = {"name": name, "idBoard": board_id, "pos": pos}
         response = await self.client.POST("/lists", data=data)
-        return TrelloList(**response)
+        invalidate(self.get_lists, arg=board_id)
+        return TrelloList.model_validate(response)
 
     async def update_list(self, list_id: str, name: str) -> TrelloList:
         """Updates the name of a list.
@@ -65,7 +73,9 @@ class ListService:
             TrelloList: The updated list object.
         """
         response = await self.client.PUT(f"/lists/{list_id}", data={"name": name})
-        return TrelloList(**response)
+        result = TrelloList.model_validate(response)
+        invalidate(self.get_lists, arg=result.idBoard)
+        return result
 
     async def delete_list(self, list_id: str) -> TrelloList:
         """Archives a list.
@@ -79,4 +89,6 @@ class ListService:
         response = await self.client.PUT(
             f"/lists/{list_id}/closed", data={"value": "true"}
         )
-        return TrelloList(**response)
+        result = TrelloList.model_validate(response)
+        invalidate(self.get_lists, arg=result.idBoard)
+        return result
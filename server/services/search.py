@@ -1,15 +1,33 @@
 import logging
-import httpx
+from typing import Any, Dict, List
+
+from pydantic import TypeAdapter
+
+from server.models import TrelloBoard, TrelloCard, TrelloMember, TrelloWorkspace
+from server.utils.trello_api import TrelloClient
 
 logger = logging.getLogger(__name__)
 
+# modelType -> adapter validating that key of the search response in one call
+_SEARCH_SHAPE = {
+    "cards": TypeAdapter(List[TrelloCard]),
+    "boards": TypeAdapter(List[TrelloBoard]),
+    "members": TypeAdapter(List[TrelloMember]),
+    "organizations": TypeAdapter(List[TrelloWorkspace]),
+}
+
 class SearchService:
-    def __init__(self, client: httpx.AsyncClient):
+    def __init__(self, client: TrelloClient):
         self.client = client
 
-    async def search(self, query: str, model_types: str = "cards,boards"):
+    async def search(
+        self, query: str, model_types: str = "cards,boards"
+    ) -> Dict[str, List[Any]]:
         """
         Search Trello for cards, boards, etc.
+
+        Returns:
+            Dict[str, List]: One list of models per requested model type.
         """
         response = await self.client.GET(
             "/search",
@@ -18,7 +36,18 @@ class SearchService:
                 "modelTypes": model_types,
                 "partial": "true",
                 "cards_limit": 20,
-                "boards_limit": 20
+                "boards_limit": 20,
+                # Only the fields the models read: cards default to all
+                # fields, and boards/organizations omit url by default
+                "card_fields": "name,desc,closed,idList,idBoard,url,pos,labels,due",
+                "board_fields": "name,desc,closed,idOrganization,url",
+                "organization_fields": "name,displayName,url,desc",
             }
         )
-        return response
+        return {
+            model_type: _SEARCH_SHAPE[model_type].validate_python(
+                response.get(model_type, [])
+            )
+            for model_type in model_types.split(",")
+            if model_type in _SEARCH_SHAPE
+        }
@@ -1,16 +1,24 @@
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 from mcp.server.fastmcp import Context
 
 from server.services.attachment import AttachmentService
-from server.trello import client
 from server.utils.auth import require_write_access
+from server.utils.errors import reports_errors
 
 logger = logging.getLogger(__name__)
 
-service = AttachmentService(client)
 
+@lru_cache(maxsize=1)
+def _svc() -> AttachmentService:
+    from server.trello import client
+
+    return AttachmentService(client)
+
+
+@reports_errors("Failed to get attachments")
 async def get_card_attachments(ctx: Context, card_id: str) -> List[Dict[str, Any]]:
     """Retrieves all attachments for a specific card.
 
@@ -20,17 +28,12 @@ async def get_card_attachments(ctx: Context, card_id: str) -> List[Dict[str, Any
     Returns:
         List[Dict]: A list of attachment objects.
     """
-    try:
-        logger.info(f"Getting attachments for card: {card_id}")
-        result = await service.get_attachments(card_id)
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get attachments: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting attachments for card: %s", card_id)
+    result = await _svc().get_attachments(card_id)
+    return result
 
 @require_write_access
+@reports_errors("Failed to add attachment")
 async def add_attachment_to_card(ctx: Context, card_id: str, url: str, name: Optional[str] = None) -> Dict[str, Any]:
     """Adds an attachment to a card using a URL.
 
@@ -42,17 +45,12 @@ async def add_attachment_to_card(ctx: Context, card_id: str, url: str, name: Opt
     Returns:
         Dict: The created attachment object.
     """
-    try:
-        logger.info(f"Adding attachment to card {card_id}: {url}")
-        result = await service.add_attachment(card_id, url, name)
-        return result
-    except Exception as e:
-        error_msg = f"Failed to add attachment: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Adding attachment to card %s: %s", card_id, url)
+    result = await _svc().add_attachment(card_id, url, name)
+    return result
 
 @require_write_access
+@reports_errors("Failed to delete attachment")
 async def delete_attachment_from_card(ctx: Context, card_id: str, attachment_id: str) -> bool:
     """Deletes an attachment from a card.
 
@@ -63,12 +61,6 @@ async def delete_attachment_from_card(ctx: Context, card_id: str, attachment_id:
     Returns:
         bool: True if successful.
     """
-    try:
-        logger.info(f"Deleting attachment {attachment_id} from card: {card_id}")
-        await service.delete_attachment(card_id, attachment_id)
-        return True
-    except Exception as e:
-        error_msg = f"Failed to delete attachment: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Deleting attachment %s from card: %s", attachment_id, card_id)
+    await _svc().delete_attachment(card_id, attachment_id)
+    return True
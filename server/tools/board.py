@@ -3,7 +3,8 @@ This module contains tools for managing Trello boards.
 """
 
 import logging
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List
 
 from mcp.server.fastmcp import Context
 
@@ -12,14 +13,29 @@ from server.dtos.create_label import CreateLabelPayload
 from server.dtos.create_board import CreateBoardPayload
 from server.dtos.update_board import UpdateBoardPayload
 from server.services.board import BoardService
-from server.trello import client
+from server.services.list import ListService
 from server.utils.auth import require_write_access
+from server.utils.errors import reports_errors
+from server.utils.prefetch import prefetch
 
 logger = logging.getLogger(__name__)
 
-service = BoardService(client)
 
+@lru_cache(maxsize=1)
+def _svc() -> BoardService:
+    from server.trello import client
 
+    return BoardService(client)
+
+
+@lru_cache(maxsize=1)
+def _list_svc() -> ListService:
+    from server.trello import client
+
+    return ListService(client)
+
+
+@reports_errors("Failed to get board")
 async def get_board(ctx: Context, board_id: str) -> TrelloBoard:
     """Retrieves a specific board by its ID.
 
@@ -29,18 +45,18 @@ async def get_board(ctx: Context, board_id: str) -> TrelloBoard:
     Returns:
         TrelloBoard: The board object containing board details.
     """
-    try:
-        logger.info(f"Getting board with ID: {board_id}")
-        result = await service.get_board(board_id)
-        logger.info(f"Successfully retrieved board: {board_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get board: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
-
-
+    logger.info("Getting board with ID: %s", board_id)
+    result = await _svc().get_board(board_id)
+    logger.info("Successfully retrieved board: %s", board_id)
+    # Agents nearly always look at a board's lists and labels next
+    prefetch(
+        lambda: _list_svc().get_lists(board_id),
+        lambda: _svc().get_board_labels(board_id),
+    )
+    return result
+
+
+@reports_errors("Failed to get boards")
 async def get_boards(ctx: Context, filter: str = "open") -> List[TrelloBoard]:
     """Retrieves all boards for the authenticated user with optional filtering.
 
@@ -51,36 +67,55 @@ async def get_boards(ctx: Context, filter: str = "open") -> List[TrelloBoard]:
     Returns:
         List[TrelloBoard]: A list of board objects.
     """
-    try:
-        logger.info(f"Getting all boards with filter: {filter}")
-        result = await service.get_boards(filter=filter)
-        logger.info(f"Successfully retrieved {len(result)} boards")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get boards: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting all boards with filter: %s", filter)
+    result = await _svc().get_boards(filter=filter)
+    logger.info("Successfully retrieved %d boards", len(result))
+    return result
+
+
+@reports_errors("Failed to get boards with details")
+async def get_boards_with_details(
+    ctx: Context,
+    filter: str = "open",
+    include_labels: bool = True,
+    include_members: bool = False,
+) -> List[Dict[str, Any]]:
+    """Retrieves all your boards together with their labels and/or members.
 
+    Prefer this over calling get_board_labels or get_board_members for each
+    board in turn; the boards are fetched concurrently and progress is
+    reported as each one completes.
+
+    Args:
+        filter (str): Filter for board status. Can be 'all', 'closed', 'members', 'open', 'organization', 'public', 'starred'. Defaults to 'open'.
+        include_labels (bool): Whether to include each board's labels. Defaults to True.
+        include_members (bool): Whether to include each board's members. Defaults to False.
 
+    Returns:
+        List[Dict[str, Any]]: One entry per board with the board under "board"
+            and the requested "labels" and/or "members".
+    """
+    logger.info("Getting boards with details (filter: %s)", filter)
+    result = await _svc().get_boards_with_details(
+        filter, include_labels, include_members, on_progress=ctx.report_progress
+    )
+    logger.info("Successfully retrieved details for %d boards", len(result))
+    return result
+
+@reports_errors("Failed to get workspaces")
 async def get_workspaces(ctx: Context) -> List[TrelloWorkspace]:
     """Retrieves all Trello Workspaces (organizations) that the current user is a member of.
 
     Returns:
         List[TrelloWorkspace]: A list of workspace objects containing ID, name, and URL.
     """
-    try:
-        logger.info("Getting all workspaces")
-        result = await service.get_workspaces()
-        logger.info(f"Successfully retrieved {len(result)} workspaces")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get workspaces: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting all workspaces")
+    result = await _svc().get_workspaces()
+    logger.info("Successfully retrieved %d workspaces", len(result))
+    return result
 
 
+@reports_errors("Failed to get workspace boards")
 async def get_workspace_boards(ctx: Context, workspace_id: str, filter: str = "open") -> List[TrelloBoard]:
     """Retrieves all boards belonging to a specific Trello Workspace.
 
@@ -92,18 +127,13 @@ async def get_workspace_boards(ctx: Context, workspace_id: str, filter: str = "o
     Returns:
         List[TrelloBoard]: A list of board objects.
     """
-    try:
-        logger.info(f"Getting boards for workspace: {workspace_id} with filter: {filter}")
-        result = await service.get_workspace_boards(workspace_id, filter=filter)
-        logger.info(f"Successfully retrieved {len(result)} boards for workspace: {workspace_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get workspace boards: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting boards for workspace: %s with filter: %s", workspace_id, filter)
+    result = await _svc().get_workspace_boards(workspace_id, filter=filter)
+    logger.info("Successfully retrieved %d boards for workspace: %s", len(result), workspace_id)
+    return result
 
 
+@reports_errors("Failed to get board labels")
 async def get_board_labels(ctx: Context, board_id: str) -> List[TrelloLabel]:
     """Retrieves all labels for a specific board.
 
@@ -113,19 +143,14 @@ async def get_board_labels(ctx: Context, board_id: str) -> List[TrelloLabel]:
     Returns:
         List[TrelloLabel]: A list of label objects for the board.
     """
-    try:
-        logger.info(f"Getting labels for board: {board_id}")
-        result = await service.get_board_labels(board_id)
-        logger.info(f"Successfully retrieved {len(result)} labels for board: {board_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get board labels: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting labels for board: %s", board_id)
+    result = await _svc().get_board_labels(board_id)
+    logger.info("Successfully retrieved %d labels for board: %s", len(result), board_id)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to get board labels")
 async def create_board_label(ctx: Context, board_id: str, payload: CreateLabelPayload) -> TrelloLabel:
     """Create label for a specific board.
 
@@ -137,18 +162,13 @@ async def create_board_label(ctx: Context, board_id: str, payload: CreateLabelPa
     Returns:
         TrelloLabel: A label object for the board.
     """
-    try:
-        logger.info(f"Creating label {payload.name} label for board: {board_id}")
-        result = await service.create_board_label(board_id, **payload.model_dump(exclude_unset=True))
-        logger.info(f"Successfully created label {payload.name} labels for board: {board_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get board labels: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Creating label %s label for board: %s", payload.name, board_id)
+    result = await _svc().create_board_label(board_id, payload)
+    logger.info("Successfully created label %s labels for board: %s", payload.name, board_id)
+    return result
 
 
+@reports_errors("Failed to get board members")
 async def get_board_members(ctx: Context, board_id: str) -> List[TrelloMember]:
     """Retrieves all members for a specific board.
     
@@ -160,34 +180,45 @@ async def get_board_members(ctx: Context, board_id: str) -> List[TrelloMember]:
     Returns:
         List[TrelloMember]: List of members.
     """
-    try:
-        logger.info(f"Getting members for board: {board_id}")
-        result = await service.get_board_members(board_id)
-        logger.info(f"Successfully retrieved {len(result)} members for board: {board_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get board members: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting members for board: %s", board_id)
+    result = await _svc().get_board_members(board_id)
+    logger.info("Successfully retrieved %d members for board: %s", len(result), board_id)
+    return result
+
+@reports_errors("Failed to get board bundle")
+async def get_board_bundle(ctx: Context, board_id: str) -> Dict[str, Any]:
+    """Retrieves a board together with its labels, members and recent actions
+    in a single request.
+
+    Prefer this over calling get_board, get_board_labels, get_board_members
+    and get_board_actions one after another; those calls are then served
+    from the cache.
+
+    Args:
+        board_id (str): The ID of the board.
+
+    Returns:
+        Dict[str, Any]: The board under "board", plus its "labels", "members"
+            and "actions".
+    """
+    logger.info("Getting bundle for board: %s", board_id)
+    result = await _svc().get_board_bundle(board_id)
+    logger.info("Successfully retrieved bundle for board: %s", board_id)
+    return result
 
+@reports_errors("Failed to get user profile")
 async def get_me(ctx: Context) -> TrelloMember:
     """Retrieves the authenticated user's profile.
     
     Returns:
         TrelloMember: Your Trello profile information.
     """
-    try:
-        logger.info("Getting current user profile")
-        result = await service.get_me()
-        logger.info(f"Successfully retrieved profile for: {result.username}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get user profile: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting current user profile")
+    result = await _svc().get_me()
+    logger.info("Successfully retrieved profile for: %s", result.username)
+    return result
 
+@reports_errors("Failed to get board actions")
 async def get_board_actions(ctx: Context, board_id: str, filter: str = "all", limit: int = 50) -> List[dict]:
     """Retrieves recent actions/activity for a Trello board.
 
@@ -199,18 +230,13 @@ async def get_board_actions(ctx: Context, board_id: str, filter: str = "all", li
     Returns:
         List[dict]: A list of recent activities on the board.
     """
-    try:
-        logger.info(f"Getting actions for board: {board_id}")
-        result = await service.get_board_actions(board_id, filter, limit)
-        logger.info(f"Successfully retrieved {len(result)} actions for board: {board_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get board actions: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting actions for board: %s", board_id)
+    result = await _svc().get_board_actions(board_id, filter, limit)
+    logger.info("Successfully retrieved %d actions for board: %s", len(result), board_id)
+    return result
 
 @require_write_access
+@reports_errors("Failed to create board")
 async def create_board(ctx: Context, payload: CreateBoardPayload) -> TrelloBoard:
     """Creates a new Trello board.
 
@@ -220,18 +246,13 @@ async def create_board(ctx: Context, payload: CreateBoardPayload) -> TrelloBoard
     Returns:
         TrelloBoard: The newly created board object.
     """
-    try:
-        logger.info(f"Creating board: {payload.name}")
-        result = await service.create_board(**payload.model_dump(exclude_unset=True))
-        logger.info(f"Successfully created board: {result.id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to create board: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Creating board: %s", payload.name)
+    result = await _svc().create_board(payload)
+    logger.info("Successfully created board: %s", result.id)
+    return result
 
 @require_write_access
+@reports_errors("Failed to update board")
 async def update_board(ctx: Context, board_id: str, payload: UpdateBoardPayload) -> TrelloBoard:
     """Updates an existing Trello board.
 
@@ -242,14 +263,8 @@ async def update_board(ctx: Context, board_id: str, payload: UpdateBoardPayload)
     Returns:
         TrelloBoard: The updated board object.
     """
-    try:
-        logger.info(f"Updating board: {board_id}")
-        result = await service.update_board(board_id, **payload.model_dump(exclude_unset=True))
-        logger.info(f"Successfully updated board: {board_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to update board: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Updating board: %s", board_id)
+    result = await _svc().update_board(board_id, payload)
+    logger.info("Successfully updated board: %s", board_id)
+    return result
 
@@ -3,23 +3,30 @@ This module contains tools for managing Trello cards.
 """
 
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any
 
 from mcp.server.fastmcp import Context
 
 from server.models import TrelloCard
 from server.services.card import CardService
-from server.trello import client
 from server.dtos.update_card import UpdateCardPayload
 from server.dtos.create_card import CreateCardPayload
 from server.dtos.copy_card import CopyCardPayload
 from server.utils.auth import require_write_access
+from server.utils.errors import reports_errors
 
 logger = logging.getLogger(__name__)
 
-service = CardService(client)
 
+@lru_cache(maxsize=1)
+def _svc() -> CardService:
+    from server.trello import client
 
+    return CardService(client)
+
+
+@reports_errors("Failed to get card")
 async def get_card(ctx: Context, card_id: str) -> TrelloCard:
     """Retrieves a specific card by its ID.
 
@@ -29,18 +36,13 @@ async def get_card(ctx: Context, card_id: str) -> TrelloCard:
     Returns:
         TrelloCard: The card object containing card details.
     """
-    try:
-        logger.info(f"Getting card with ID: {card_id}")
-        result = await service.get_card(card_id)
-        logger.info(f"Successfully retrieved card: {card_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get card: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting card with ID: %s", card_id)
+    result = await _svc().get_card(card_id)
+    logger.info("Successfully retrieved card: %s", card_id)
+    return result
 
 
+@reports_errors("Failed to get cards")
 async def get_cards(ctx: Context, list_id: str) -> List[TrelloCard]:
     """Retrieves all cards in a given list.
 
@@ -50,19 +52,14 @@ async def get_cards(ctx: Context, list_id: str) -> List[TrelloCard]:
     Returns:
         List[TrelloCard]: A list of card objects.
     """
-    try:
-        logger.info(f"Getting cards for list: {list_id}")
-        result = await service.get_cards(list_id)
-        logger.info(f"Successfully retrieved {len(result)} cards for list: {list_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get cards: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting cards for list: %s", list_id)
+    result = await _svc().get_cards(list_id)
+    logger.info("Successfully retrieved %d cards for list: %s", len(result), list_id)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to create card")
 async def create_card(ctx: Context, payload: CreateCardPayload) -> TrelloCard:
     """Creates a new card in a given list.
 
@@ -74,19 +71,14 @@ async def create_card(ctx: Context, payload: CreateCardPayload) -> TrelloCard:
     Returns:
         TrelloCard: The newly created card object.
     """
-    try:
-        logger.info(f"Creating card in list {payload.idList} with name: {payload.name}")
-        result = await service.create_card(**payload.model_dump(exclude_unset=True))
-        logger.info(f"Successfully created card in list: {payload.idList}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to create card: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Creating card in list %s with name: %s", payload.idList, payload.name)
+    result = await _svc().create_card(payload)
+    logger.info("Successfully created card in list: %s", payload.idList)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to update card")
 async def update_card(
     ctx: Context, card_id: str, payload: UpdateCardPayload
 ) -> TrelloCard:
@@ -99,21 +91,14 @@ async def update_card(
     Returns:
         TrelloCard: The updated card object.
     """
-    try:
-        logger.info(f"Updating card: {card_id} with payload: {payload}")
-        result = await service.update_card(
-            card_id, **payload.model_dump(exclude_unset=True)
-        )
-        logger.info(f"Successfully updated card: {card_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to update card: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Updating card: %s with payload: %s", card_id, payload)
+    result = await _svc().update_card(card_id, payload)
+    logger.info("Successfully updated card: %s", card_id)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to delete card")
 async def delete_card(ctx: Context, card_id: str) -> dict:
     """Deletes a card.
 
@@ -123,17 +108,12 @@ async def delete_card(ctx: Context, card_id: str) -> dict:
     Returns:
         dict: The response from the delete operation.
     """
-    try:
-        logger.info(f"Deleting card: {card_id}")
-        result = await service.delete_card(card_id)
-        logger.info(f"Successfully deleted card: {card_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to delete card: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Deleting card: %s", card_id)
+    result = await _svc().delete_card(card_id)
+    logger.info("Successfully deleted card: %s", card_id)
+    return result
 
+@reports_errors("Failed to get card comments")
 async def get_card_comments(ctx: Context, card_id: str) -> List[Dict[str, Any]]:
     """Retrieves all comments for a specific card.
 
@@ -143,19 +123,14 @@ async def get_card_comments(ctx: Context, card_id: str) -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: A list of comment actions.
     """
-    try:
-        logger.info(f"Getting comments for card: {card_id}")
-        result = await service.get_comments(card_id)
-        logger.info(f"Successfully retrieved comments for card: {card_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get card comments: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting comments for card: %s", card_id)
+    result = await _svc().get_comments(card_id)
+    logger.info("Successfully retrieved comments for card: %s", card_id)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to add comment")
 async def add_comment_to_card(ctx: Context, card_id: str, text: str) -> Dict[str, Any]:
     """Adds a new comment to a card.
 
@@ -166,18 +141,13 @@ async def add_comment_to_card(ctx: Context, card_id: str, text: str) -> Dict[str
     Returns:
         Dict: The created comment action.
     """
-    try:
-        logger.info(f"Adding comment to card: {card_id}")
-        result = await service.add_comment(card_id, text)
-        logger.info(f"Successfully added comment to card: {card_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to add comment: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Adding comment to card: %s", card_id)
+    result = await _svc().add_comment(card_id, text)
+    logger.info("Successfully added comment to card: %s", card_id)
+    return result
 
 @require_write_access
+@reports_errors("Failed to add member")
 async def add_member_to_card(ctx: Context, card_id: str, member_id: str) -> List[Dict[str, Any]]:
     """Adds a member to a card.
 
@@ -188,19 +158,14 @@ async def add_member_to_card(ctx: Context, card_id: str, member_id: str) -> List
     Returns:
         List[Dict]: The updated list of members on the card.
     """
-    try:
-        logger.info(f"Adding member {member_id} to card: {card_id}")
-        result = await service.add_member(card_id, member_id)
-        logger.info(f"Successfully added member to card: {card_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to add member: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Adding member %s to card: %s", member_id, card_id)
+    result = await _svc().add_member(card_id, member_id)
+    logger.info("Successfully added member to card: %s", card_id)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to remove member")
 async def remove_member_from_card(ctx: Context, card_id: str, member_id: str) -> List[Dict[str, Any]]:
     """Removes a member from a card.
 
@@ -211,19 +176,36 @@ async def remove_member_from_card(ctx: Context, card_id: str, member_id: str) ->
     Returns:
         List[Dict]: The updated list of members on the card.
     """
-    try:
-        logger.info(f"Removing member {member_id} from card: {card_id}")
-        result = await service.remove_member(card_id, member_id)
-        logger.info(f"Successfully removed member from card: {card_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to remove member: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Removing member %s from card: %s", member_id, card_id)
+    result = await _svc().remove_member(card_id, member_id)
+    logger.info("Successfully removed member from card: %s", card_id)
+    return result
+
+
+@require_write_access
+@reports_errors("Failed to set card members")
+async def set_card_members(ctx: Context, card_id: str, member_ids: List[str]) -> TrelloCard:
+    """Replaces all members of a card in one call.
+
+    Prefer this over several add_member_to_card / remove_member_from_card
+    calls when more than one member changes, e.g. to swap members.
+
+    Args:
+        card_id (str): The ID of the card.
+        member_ids (List[str]): The IDs of every member the card should have.
+            An empty list removes all members.
+
+    Returns:
+        TrelloCard: The updated card object.
+    """
+    logger.info("Setting %d members on card: %s", len(member_ids), card_id)
+    result = await _svc().set_members(card_id, member_ids)
+    logger.info("Successfully set members on card: %s", card_id)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to copy card")
 async def copy_card(ctx: Context, payload: CopyCardPayload) -> TrelloCard:
     """Clones an existing Trello card to a new list.
 
@@ -233,13 +215,7 @@ async def copy_card(ctx: Context, payload: CopyCardPayload) -> TrelloCard:
     Returns:
         TrelloCard: The newly created (cloned) card object.
     """
-    try:
-        logger.info(f"Copying card {payload.idCardSource} to list {payload.idList}")
-        result = await service.copy_card(**payload.model_dump(exclude_unset=True))
-        logger.info(f"Successfully copied card to: {result.id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to copy card: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Copying card %s to list %s", payload.idCardSource, payload.idList)
+    result = await _svc().copy_card(payload)
+    logger.info("Successfully copied card to: %s", result.id)
+    return result
@@ -3,14 +3,20 @@ This module contains tools for managing Trello checklists.
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, List
 
 from server.services.checklist import ChecklistService
-from server.trello import client
 from server.utils.auth import require_write_access
 
 logger = logging.getLogger(__name__)
-service = ChecklistService(client)
+
+
+@lru_cache(maxsize=1)
+def _svc() -> ChecklistService:
+    from server.trello import client
+
+    return ChecklistService(client)
 
 
 async def get_checklist(checklist_id: str) -> Dict:
@@ -23,7 +29,7 @@ async def get_checklist(checklist_id: str) -> Dict:
     Returns:
         Dict: The checklist data
     """
-    return await service.get_checklist(checklist_id)
+    return await _svc().get_checklist(checklist_id)
 
 
 async def get_card_checklists(card_id: str) -> List[Dict]:
@@ -36,7 +42,7 @@ async def get_card_checklists(card_id: str) -> List[Dict]:
     Returns:
         List[Dict]: List of checklists on the card
     """
-    return await service.get_card_checklists(card_id)
+    return await _svc().get_card_checklists(card_id)
 
 
 @require_write_access
@@ -52,7 +58,7 @@ async def create_checklist(card_id: str, name: str, pos: str | None = None) -> D
     Returns:
         Dict: The created checklist data
     """
-    return await service.create_checklist(card_id, name, pos)
+    return await _svc().create_checklist(card_id, name, pos)
 
 
 @require_write_access
@@ -70,7 +76,7 @@ async def update_checklist(
     Returns:
         Dict: The updated checklist data
     """
-    return await service.update_checklist(checklist_id, name, pos)
+    return await _svc().update_checklist(checklist_id, name, pos)
 
 
 @require_write_access
@@ -84,7 +90,7 @@ async def delete_checklist(checklist_id: str) -> Dict:
     Returns:
         Dict: The response from the delete operation
     """
-    return await service.delete_checklist(checklist_id)
+    return await _svc().delete_checklist(checklist_id)
 
 
 @require_write_access
@@ -103,7 +109,7 @@ async def add_checkitem(
     Returns:
         Dict: The created checkitem data
     """
-    return await service.add_checkitem(checklist_id, name, checked, pos)
+    return await _svc().add_checkitem(checklist_id, name, checked, pos)
 
 
 @require_write_access
@@ -127,7 +133,7 @@ async def update_checkitem(
     Returns:
         Dict: The updated checkitem data
     """
-    return await service.update_checkitem(
+    return await _svc().update_checkitem(
         checklist_id, checkitem_id, name, checked, pos
     )
 
@@ -144,4 +150,4 @@ async def delete_checkitem(checklist_id: str, checkitem_id: str) -> Dict:
     Returns:
         Dict: The response from the delete operation
     """
-    return await service.delete_checkitem(checklist_id, checkitem_id)
+    return await _svc().delete_checkitem(checklist_id, checkitem_id)
@@ -1,16 +1,24 @@
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Union
 
 from mcp.server.fastmcp import Context
 
 from server.services.custom_field import CustomFieldService
-from server.trello import client
 from server.utils.auth import require_write_access
+from server.utils.errors import reports_errors
 
 logger = logging.getLogger(__name__)
 
-service = CustomFieldService(client)
 
+@lru_cache(maxsize=1)
+def _svc() -> CustomFieldService:
+    from server.trello import client
+
+    return CustomFieldService(client)
+
+
+@reports_errors("Failed to get board custom fields")
 async def get_board_custom_field_definitions(ctx: Context, board_id: str) -> List[Dict[str, Any]]:
     """Retrieves all custom field definitions available on a specific board.
     
@@ -23,16 +31,11 @@ async def get_board_custom_field_definitions(ctx: Context, board_id: str) -> Lis
     Returns:
         List[Dict]: A list of custom field definitions.
     """
-    try:
-        logger.info(f"Getting custom field definitions for board: {board_id}")
-        result = await service.get_board_custom_fields(board_id)
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get board custom fields: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting custom field definitions for board: %s", board_id)
+    result = await _svc().get_board_custom_fields(board_id)
+    return result
 
+@reports_errors("Failed to get card custom fields")
 async def get_card_custom_field_items(ctx: Context, card_id: str) -> List[Dict[str, Any]]:
     """Retrieves the values of custom fields set on a specific card.
 
@@ -42,17 +45,12 @@ async def get_card_custom_field_items(ctx: Context, card_id: str) -> List[Dict[s
     Returns:
         List[Dict]: A list of custom field items (values).
     """
-    try:
-        logger.info(f"Getting custom field items for card: {card_id}")
-        result = await service.get_card_custom_fields(card_id)
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get card custom fields: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting custom field items for card: %s", card_id)
+    result = await _svc().get_card_custom_fields(card_id)
+    return result
 
 @require_write_access
+@reports_errors("Failed to update custom field")
 async def update_card_custom_field_value(
     ctx: Context, 
     card_id: str, 
@@ -75,12 +73,6 @@ async def update_card_custom_field_value(
     Returns:
         Dict: The response from the update operation.
     """
-    try:
-        logger.info(f"Updating custom field {custom_field_id} on card {card_id} with value: {value}")
-        result = await service.update_card_custom_field(card_id, custom_field_id, value)
-        return result
-    except Exception as e:
-        error_msg = f"Failed to update custom field: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Updating custom field %s on card %s with value: %s", custom_field_id, card_id, value)
+    result = await _svc().update_card_custom_field(card_id, custom_field_id, value)
+    return result
@@ -3,21 +3,28 @@ This module contains tools for managing Trello lists.
 """
 
 import logging
+from functools import lru_cache
 from typing import List
 
 from mcp.server.fastmcp import Context
 
 from server.models import TrelloList
 from server.services.list import ListService
-from server.trello import client
 from server.utils.auth import require_write_access
+from server.utils.errors import reports_errors
 
 logger = logging.getLogger(__name__)
 
-service = ListService(client)
+
+@lru_cache(maxsize=1)
+def _svc() -> ListService:
+    from server.trello import client
+
+    return ListService(client)
 
 
 # List Tools
+@reports_errors("Failed to get list")
 async def get_list(ctx: Context, list_id: str) -> TrelloList:
     """Retrieves a specific list by its ID.
 
@@ -27,18 +34,13 @@ async def get_list(ctx: Context, list_id: str) -> TrelloList:
     Returns:
         TrelloList: The list object containing list details.
     """
-    try:
-        logger.info(f"Getting list with ID: {list_id}")
-        result = await service.get_list(list_id)
-        logger.info(f"Successfully retrieved list: {list_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get list: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting list with ID: %s", list_id)
+    result = await _svc().get_list(list_id)
+    logger.info("Successfully retrieved list: %s", list_id)
+    return result
 
 
+@reports_errors("Failed to get lists")
 async def get_lists(ctx: Context, board_id: str) -> List[TrelloList]:
     """Retrieves all lists on a given board.
 
@@ -48,19 +50,14 @@ async def get_lists(ctx: Context, board_id: str) -> List[TrelloList]:
     Returns:
         List[TrelloList]: A list of list objects.
     """
-    try:
-        logger.info(f"Getting lists for board: {board_id}")
-        result = await service.get_lists(board_id)
-        logger.info(f"Successfully retrieved {len(result)} lists for board: {board_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to get lists: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Getting lists for board: %s", board_id)
+    result = await _svc().get_lists(board_id)
+    logger.info("Successfully retrieved %d lists for board: %s", len(result), board_id)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to create list")
 async def create_list(
     ctx: Context, board_id: str, name: str, pos: str = "bottom"
 ) -> TrelloList:
@@ -74,19 +71,14 @@ async def create_list(
     Returns:
         TrelloList: The newly created list object.
     """
-    try:
-        logger.info(f"Creating list '{name}' in board: {board_id}")
-        result = await service.create_list(board_id, name, pos)
-        logger.info(f"Successfully created list '{name}' in board: {board_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to create list: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Creating list '%s' in board: %s", name, board_id)
+    result = await _svc().create_list(board_id, name, pos)
+    logger.info("Successfully created list '%s' in board: %s", name, board_id)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to update list")
 async def update_list(ctx: Context, list_id: str, name: str) -> TrelloList:
     """Updates the name of a list.
 
@@ -97,19 +89,14 @@ async def update_list(ctx: Context, list_id: str, name: str) -> TrelloList:
     Returns:
         TrelloList: The updated list object.
     """
-    try:
-        logger.info(f"Updating list {list_id} with new name: {name}")
-        result = await service.update_list(list_id, name)
-        logger.info(f"Successfully updated list: {list_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to update list: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Updating list %s with new name: %s", list_id, name)
+    result = await _svc().update_list(list_id, name)
+    logger.info("Successfully updated list: %s", list_id)
+    return result
 
 
 @require_write_access
+@reports_errors("Failed to delete list")
 async def delete_list(ctx: Context, list_id: str) -> TrelloList:
     """Archives a list.
 
@@ -119,13 +106,7 @@ async def delete_list(ctx: Context, list_id: str) -> TrelloList:
     Returns:
         TrelloList: The archived list object.
     """
-    try:
-        logger.info(f"Archiving list: {list_id}")
-        result = await service.delete_list(list_id)
-        logger.info(f"Successfully archived list: {list_id}")
-        return result
-    except Exception as e:
-        error_msg = f"Failed to delete list: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Archiving list: %s", list_id)
+    result = await _svc().delete_list(list_id)
+    logger.info("Successfully archived list: %s", list_id)
+    return result
@@ -1,14 +1,22 @@
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List
 
 from mcp.server.fastmcp import Context
 from server.services.search import SearchService
-from server.trello import client
+from server.utils.errors import reports_errors
 
 logger = logging.getLogger(__name__)
 
-service = SearchService(client)
 
+@lru_cache(maxsize=1)
+def _svc() -> SearchService:
+    from server.trello import client
+
+    return SearchService(client)
+
+
+@reports_errors("Search failed")
 async def search_trello(ctx: Context, query: str) -> Dict[str, Any]:
     """
     Search for Trello cards and boards using a query string.
@@ -19,16 +27,7 @@ async def search_trello(ctx: Context, query: str) -> Dict[str, Any]:
     Returns:
         Dict: Search results containing lists of cards and boards.
     """
-    try:
-        logger.info(f"Searching Trello for: {query}")
-        result = await service.search(query)
-        logger.info(f"Search completed for: {query}")
-        return {
-            "cards": result.get("cards", []),
-            "boards": result.get("boards", [])
-        }
-    except Exception as e:
-        error_msg = f"Search failed: {str(e)}"
-        logger.error(error_msg)
-        await ctx.error(error_msg)
-        raise
+    logger.info("Searching Trello for: %s", query)
+    result = await _svc().search(query)
+    logger.info("Search completed for: %s", query)
+    return result
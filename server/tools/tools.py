@@ -1,65 +1,86 @@
 """
 This module contains tools for managing Trello boards, lists, and cards.
+
+Every tool must be an ``async def``: FastMCP calls sync tools directly on the
+event loop, blocking every other session while Trello answers. Anything that
+streams must likewise use async generators (``async for``), never sync ones,
+which Starlette iterates in its threadpool.
 """
 
+import inspect
+
 from server.tools import board, card, checklist, list, search, attachment, custom_field
 
 
-def register_tools(mcp):
-    """Register tools with the MCP server."""
+# Every tool exposed by the server, in registration order
+TOOLS = (
     # Board Tools
-    mcp.add_tool(board.get_board)
-    mcp.add_tool(board.get_boards)
-    mcp.add_tool(board.get_board_labels)
-    mcp.add_tool(board.create_board_label)
-    mcp.add_tool(board.get_board_members)
-    mcp.add_tool(board.get_workspaces)
-    mcp.add_tool(board.get_workspace_boards)
-    mcp.add_tool(board.get_me)
-    mcp.add_tool(board.get_board_actions)
-    mcp.add_tool(board.create_board)
-    mcp.add_tool(board.update_board)
+    board.get_board,
+    board.get_boards,
+    board.get_boards_with_details,
+    board.get_board_labels,
+    board.create_board_label,
+    board.get_board_members,
+    board.get_board_bundle,
+    board.get_workspaces,
+    board.get_workspace_boards,
+    board.get_me,
+    board.get_board_actions,
+    board.create_board,
+    board.update_board,
 
     # List Tools
-    mcp.add_tool(list.get_list)
-    mcp.add_tool(list.get_lists)
-    mcp.add_tool(list.create_list)
-    mcp.add_tool(list.update_list)
-    mcp.add_tool(list.delete_list)
+    list.get_list,
+    list.get_lists,
+    list.create_list,
+    list.update_list,
+    list.delete_list,
 
     # Card Tools
-    mcp.add_tool(card.get_card)
-    mcp.add_tool(card.get_cards)
-    mcp.add_tool(card.create_card)
-    mcp.add_tool(card.update_card)
-    mcp.add_tool(card.delete_card)
+    card.get_card,
+    card.get_cards,
+    card.create_card,
+    card.update_card,
+    card.delete_card,
     # New Comment Tools
-    mcp.add_tool(card.get_card_comments)
-    mcp.add_tool(card.add_comment_to_card)
+    card.get_card_comments,
+    card.add_comment_to_card,
     # New Member Tools
-    mcp.add_tool(card.add_member_to_card)
-    mcp.add_tool(card.remove_member_from_card)
-    mcp.add_tool(card.copy_card)
+    card.add_member_to_card,
+    card.remove_member_from_card,
+    card.set_card_members,
+    card.copy_card,
 
     # Attachment Tools
-    mcp.add_tool(attachment.get_card_attachments)
-    mcp.add_tool(attachment.add_attachment_to_card)
-    mcp.add_tool(attachment.delete_attachment_from_card)
+    attachment.get_card_attachments,
+    attachment.add_attachment_to_card,
+    attachment.delete_attachment_from_card,
 
     # Custom Field Tools
-    mcp.add_tool(custom_field.get_board_custom_field_definitions)
-    mcp.add_tool(custom_field.get_card_custom_field_items)
-    mcp.add_tool(custom_field.update_card_custom_field_value)
+    custom_field.get_board_custom_field_definitions,
+    custom_field.get_card_custom_field_items,
+    custom_field.update_card_custom_field_value,
 
     # Checklist Tools
-    mcp.add_tool(checklist.get_checklist)
-    mcp.add_tool(checklist.get_card_checklists)
-    mcp.add_tool(checklist.create_checklist)
-    mcp.add_tool(checklist.update_checklist)
-    mcp.add_tool(checklist.delete_checklist)
-    mcp.add_tool(checklist.add_checkitem)
-    mcp.add_tool(checklist.update_checkitem)
-    mcp.add_tool(checklist.delete_checkitem)
+    checklist.get_checklist,
+    checklist.get_card_checklists,
+    checklist.create_checklist,
+    checklist.update_checklist,
+    checklist.delete_checklist,
+    checklist.add_checkitem,
+    checklist.update_checkitem,
+    checklist.delete_checkitem,
 
     # Search Tool
-    mcp.add_tool(search.search_trello)
+    search.search_trello,
+)
+
+for _tool in TOOLS:
+    if not inspect.iscoroutinefunction(_tool):
+        raise TypeError(f"Tool '{_tool.__name__}' must be defined with 'async def'")
+
+
+def register_tools(mcp):
+    """Register tools with the MCP server."""
+    for tool in TOOLS:
+        mcp.add_tool(tool)
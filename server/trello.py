@@ -26,7 +26,7 @@ try:
     client = TrelloClient(api_key=api_key, token=token)
     logger.info("Trello client and service initialized successfully")
 except Exception as e:
-    logger.error(f"Failed to initialize Trello client: {str(e)}")
+    logger.error("Failed to initialize Trello client: %s", e)
     raise
 
 
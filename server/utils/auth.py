@@ -12,13 +12,24 @@ class Role(Enum):
 # ContextVar to store the role of the current request
 api_key_role: ContextVar[Role] = ContextVar("api_key_role")
 
+# Enum members are singletons, so the write check can be an identity test
+_RW = Role.READ_WRITE
+
 def require_write_access(f):
     """Decorator to ensure the current API key has read-write access."""
+    # Denial messages only depend on the tool and the caller's role, so they
+    # are built once per tool instead of on every rejected call
+    name = f.__name__
+    denied = {
+        role: f"Tool '{name}' requires read-write access. Your current API key only has {role.value if role else 'no'} access."
+        for role in (None, *Role)
+    }
+
     @wraps(f)
     async def wrapper(*args, **kwargs):
         role = api_key_role.get(None)
-        if role != Role.READ_WRITE:
-            logger.warning(f"Unauthorized write attempt to tool: {f.__name__}. Role: {role}")
-            raise PermissionError(f"Tool '{f.__name__}' requires read-write access. Your current API key only has {role.value if role else 'no'} access.")
+        if role is not _RW:
+            logger.warning("Unauthorized write attempt to tool: %s. Role: %s", name, role)
+            raise PermissionError(denied[role])
         return await f(*args, **kwargs)
     return wrapper
@@ -0,0 +1,148 @@
+"""
+Short-lived in-memory cache for read-only Trello service calls.
+
+Agents tend to re-read the same board, labels and members several times in a
+single conversation, so those reads are kept for a few seconds instead of
+going back to Trello each time.
+"""
+
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+# Seconds a cached result stays fresh, by policy name
+CACHE_POLICIES = {
+    "short": 5.0,
+    "normal": 20.0,
+    "long": 60.0,
+}
+CACHE_MAX_ENTRIES = 512
+
+# (method qualname, args, kwargs) -> (expires_at, result)
+_entries: dict[tuple, tuple[float, object]] = {}
+# Keys with a call in flight -> [generation, number of calls in flight].
+# invalidate() bumps the generation, so a call that started before a write
+# does not store its (pre-write) result afterwards.
+_pending: dict[tuple, list[int]] = {}
+
+
+def _evict(now: float):
+    """Drop expired entries, then the oldest ones if the cache is still full."""
+    for key in [key for key, (expires_at, _) in _entries.items() if expires_at <= now]:
+        del _entries[key]
+    while len(_entries) >= CACHE_MAX_ENTRIES:
+        del _entries[next(iter(_entries))]
+
+
+def _begin(key: tuple) -> tuple[list[int], int]:
+    """Register a call in flight for key; returns its record and generation."""
+    pending = _pending.setdefault(key, [0, 0])
+    pending[1] += 1
+    return pending, pending[0]
+
+
+def _end(key: tuple, pending: list[int]):
+    pending[1] -= 1
+    if not pending[1]:
+        del _pending[key]
+
+
+def _store(key: tuple, ttl: float, value):
+    now = time.monotonic()
+    if len(_entries) >= CACHE_MAX_ENTRIES:
+        _evict(now)
+    _entries[key] = (now + ttl, value)
+
+
+def cached(policy: str = "normal"):
+    """Caches the result of an async service method for the policy's TTL.
+
+    Entries are keyed by the method's qualified name and its arguments, not
+    including ``self``.
+
+    Args:
+        policy (str): One of the CACHE_POLICIES names. Defaults to "normal".
+    """
+    ttl = CACHE_POLICIES[policy]
+
+    def decorator(f):
+        name = f.__qualname__
+
+        @wraps(f)
+        async def wrapper(self, *args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            entry = _entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+            pending, generation = _begin(key)
+            try:
+                result = await f(self, *args, **kwargs)
+            finally:
+                _end(key, pending)
+
+            # Invalidated while the call ran: the result may predate the write
+            if pending[0] == generation:
+                _store(key, ttl, result)
+            return result
+
+        wrapper.cache_ttl = ttl
+        return wrapper
+
+    return decorator
+
+
+def invalidate(*methods, arg=None):
+    """Drops cached results of the given methods.
+
+    Calls to them that are still in flight will not store their result.
+
+    Args:
+        *methods: The cached methods (bound or unbound) whose entries to drop.
+        arg: When given, only drop entries for calls that received this
+            positional argument, e.g. a board ID.
+    """
+    names = {method.__qualname__ for method in methods}
+
+    def matches(key):
+        return key[0] in names and (arg is None or arg in key[1])
+
+    for key in [key for key in _entries if matches(key)]:
+        del _entries[key]
+    for key, pending in _pending.items():
+        if matches(key):
+            pending[0] += 1
+
+
+@contextmanager
+def priming(*calls):
+    """Fills cached methods from a response fetched inside the block.
+
+    Used when one Trello response already contains what other cached methods
+    would fetch, so their next call is a hit. The calls are registered as in
+    flight for the whole block, so a write that invalidates one of them while
+    the response is fetched keeps its pre-write value out of the cache.
+
+    Yields ``prime(method, *args, value=...)``, which stores value for one of
+    the registered calls.
+
+    Args:
+        *calls: ``(method, *args)`` tuples for the cached methods (bound or
+            unbound) and positional arguments the block may fill.
+    """
+    registered = {}
+    for method, *args in calls:
+        key = (method.__qualname__, tuple(args), ())
+        registered[key] = (method.cache_ttl, *_begin(key))
+
+    def prime(method, *args, value):
+        key = (method.__qualname__, args, ())
+        ttl, pending, generation = registered[key]
+        if pending[0] == generation:
+            _store(key, ttl, value)
+
+    try:
+        yield prime
+    finally:
+        for key, (_, pending, _) in registered.items():
+            _end(key, pending)
@@ -0,0 +1,39 @@
+"""
+Coalescing of identical concurrent async calls.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its result.
+
+    Callers arriving while a call for their key is in flight await that call
+    instead of starting their own. The shared task is shielded, so one caller
+    being cancelled does not cancel it for the others.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Awaits call(), or the call already in flight for key."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        return await asyncio.shield(task)
+
+    def detach(self):
+        """Stops new callers from joining the calls currently in flight.
+
+        Those calls still finish for the callers already awaiting them.
+        """
+        self._inflight.clear()
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        # A detached task must not remove a newer call made for the same key
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
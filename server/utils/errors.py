@@ -0,0 +1,28 @@
+from functools import wraps
+import logging
+
+
+def reports_errors(message: str):
+    """Decorator reporting a failing tool's exception to the log and the MCP client.
+
+    The error is logged as "<message>: <error>", sent to the client through
+    ``ctx.error`` and re-raised. The wrapped tool keeps its signature and
+    docstring, which FastMCP reads to build the tool schema.
+
+    Args:
+        message (str): What failed, e.g. "Failed to get board".
+    """
+    def decorator(f):
+        tool_logger = logging.getLogger(f.__module__)
+
+        @wraps(f)
+        async def wrapper(ctx, *args, **kwargs):
+            try:
+                return await f(ctx, *args, **kwargs)
+            except Exception as e:
+                error_msg = f"{message}: {e}"
+                tool_logger.error(error_msg)
+                await ctx.error(error_msg)
+                raise
+        return wrapper
+    return decorator
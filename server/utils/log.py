@@ -0,0 +1,39 @@
+"""
+Moves log output off the event loop.
+
+Tool handlers log on every call. With this in place a log call only formats
+the record's message and pushes it onto a queue. A listener thread does the
+actual stream writes.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_listener: QueueListener | None = None
+
+
+def enable_queue_logging():
+    """Routes the root logger's handlers through a background QueueListener.
+
+    Call this after logging is configured. Calling it again is a no-op.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    if not handlers:
+        return
+
+    log_queue = queue.SimpleQueue()
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(_listener.stop)
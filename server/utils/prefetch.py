@@ -0,0 +1,57 @@
+"""
+Speculative background reads of the Trello calls an agent usually makes next.
+
+The prefetched results land in the TTL cache (server/utils/cache.py), and a
+real call made while a prefetch is still running joins its in-flight request,
+so either way the follow-up call does not wait on a fresh round-trip.
+"""
+
+import asyncio
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# Most prefetch requests in flight at once, leaving room under Trello's rate
+# limit for the calls agents actually make
+PREFETCH_CONCURRENCY = 4
+
+_semaphore = asyncio.Semaphore(PREFETCH_CONCURRENCY)
+# Strong references so pending prefetch tasks are not garbage collected
+_tasks: set[asyncio.Task] = set()
+
+
+@lru_cache(maxsize=1)
+def prefetch_enabled() -> bool:
+    """Whether prefetching is on (TRELLO_PREFETCH, enabled by default).
+
+    Read on first use rather than at import, after main has loaded .env.
+    """
+    return os.getenv("TRELLO_PREFETCH", "true").lower() in ("1", "true", "yes")
+
+
+def prefetch(*calls: Callable[[], Awaitable[Any]]):
+    """Runs the given calls in the background, ignoring their results.
+
+    Failures are only logged at debug level: the real call will surface them.
+
+    Args:
+        *calls: Zero-argument callables returning the awaitable to run, e.g.
+            ``lambda: service.get_lists(board_id)``.
+    """
+    if not prefetch_enabled():
+        return
+    for call in calls:
+        task = asyncio.ensure_future(_run(call))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+
+
+async def _run(call: Callable[[], Awaitable[Any]]):
+    async with _semaphore:
+        try:
+            await call()
+        except Exception as e:
+            logger.debug("Prefetch failed: %s", e)
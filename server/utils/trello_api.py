@@ -2,12 +2,28 @@
 import logging
 
 import httpx
+import orjson
+
+from server.utils.coalesce import SingleFlight
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 TRELLO_API_BASE = "https://api.trello.com/1"
 
+# One pooled client is shared by every service, so keep connections to
+# api.trello.com alive between tool calls instead of re-handshaking TLS.
+# Over HTTP/2 concurrent calls are multiplexed on the same connection.
+# Idle sockets are kept for 90s so an agent pausing between tool calls
+# still finds a warm connection.
+TRELLO_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=50, max_connections=100, keepalive_expiry=90.0
+)
+TRELLO_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Write bodies are serialized with orjson rather than httpx's stdlib json
+JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class TrelloClient:
     """
@@ -18,79 +34,105 @@ class TrelloClient:
         self.api_key = api_key
         self.token = token
         self.base_url = TRELLO_API_BASE
-        self.client = httpx.AsyncClient(base_url=self.base_url)
+        # The httpx client (and its SSL context) is built on the first
+        # request, inside the running event loop
+        self._client: httpx.AsyncClient | None = None
+        # Identical reads issued concurrently share one upstream request.
+        # Every write detaches them, so a read made after a write never joins
+        # a request that was sent before it.
+        self._gets = SingleFlight()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            # Credentials are default query params, merged by httpx into every
+            # request instead of being copied into a fresh dict per call.
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                params={"key": self.api_key, "token": self.token},
+                headers={"Accept": "application/json"},
+                limits=TRELLO_HTTP_LIMITS,
+                timeout=TRELLO_HTTP_TIMEOUT,
+                http2=True,
+            )
+        return self._client
 
     async def close(self):
-        await self.client.aclose()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def GET(self, endpoint: str, params: dict = None):
-        all_params = {"key": self.api_key, "token": self.token}
-        if params:
-            all_params.update(params)
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        return await self._gets.do(key, lambda: self._get(endpoint, params))
+
+    async def _get(self, endpoint: str, params: dict = None):
         try:
-            response = await self.client.get(endpoint, params=all_params)
+            response = await self.client.get(endpoint, params=params)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e}")
+            logger.error("HTTP error: %s", e)
             raise httpx.HTTPStatusError(
                 f"Failed to get {endpoint}: {str(e)}",
                 request=e.request,
                 response=e.response,
             )
         except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             raise httpx.RequestError(f"Failed to get {endpoint}: {str(e)}")
 
     async def POST(self, endpoint: str, data: dict = None):
-        all_params = {"key": self.api_key, "token": self.token}
         try:
-            response = await self.client.post(endpoint, params=all_params, json=data)
+            response = await self.client.post(
+                endpoint, content=orjson.dumps(data or {}), headers=JSON_HEADERS
+            )
+            self._gets.detach()
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e}")
+            logger.error("HTTP error: %s", e)
             raise httpx.HTTPStatusError(
                 f"Failed to post to {endpoint}: {str(e)}",
                 request=e.request,
                 response=e.response,
             )
         except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             raise httpx.RequestError(f"Failed to post to {endpoint}: {str(e)}")
 
     async def PUT(self, endpoint: str, data: dict = None):
-        all_params = {"key": self.api_key, "token": self.token}
         try:
-            response = await self.client.put(endpoint, params=all_params, json=data)
+            response = await self.client.put(
+                endpoint, content=orjson.dumps(data or {}), headers=JSON_HEADERS
+            )
+            self._gets.detach()
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e}")
+            logger.error("HTTP error: %s", e)
             raise httpx.HTTPStatusError(
                 f"Failed to put to {endpoint}: {str(e)}",
                 request=e.request,
                 response=e.response,
             )
         except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             raise httpx.RequestError(f"Failed to put to {endpoint}: {str(e)}")
 
     async def DELETE(self, endpoint: str, params: dict = None):
-        all_params = {"key": self.api_key, "token": self.token}
-        if params:
-            all_params.update(params)
         try:
-            response = await self.client.delete(endpoint, params=all_params)
+            response = await self.client.delete(endpoint, params=params)
+            self._gets.detach()
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e}")
+            logger.error("HTTP error: %s", e)
             raise httpx.HTTPStatusError(
                 f"Failed to delete {endpoint}: {str(e)}",
                 request=e.request,
                 response=e.response,
             )
         except httpx.RequestError as e:
-            logger.error(f"Request error: {e}")
+            logger.error("Request error: %s", e)
             raise httpx.RequestError(f"Failed to delete {endpoint}: {str(e)}")